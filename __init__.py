@@ -8,4 +8,4 @@ from tkfire import *
 
 __all__ = ["TkFire", "Memory", "spec", "post", "stub",
            "fire_pack", "fire_place", "fire_grid",
-           "LAYOUT", "TYPE", "CHILDREN", "POST"]
+           "LAYOUT", "TYPE", "CHILDREN", "POST", "LAZY"]
@@ -6,9 +6,6 @@
 from tkinter import Variable
 
 
-NOT_FILLED = type(...)
-
-
 class Memory(dict):
     """ A dictionary-like container for any variables and values requiring unpacking in a TkFire object's creation
 
@@ -23,29 +20,38 @@ class Memory(dict):
     that a variable needs to be unpacked.
     """
     def __contains__(self, item):
+        # Plain string keys are the common case, skip the unwrapping for them
+        if type(item) is str:
+            return dict.__contains__(self, item)
         if isinstance(item, (VarArg, VarSpec)):
             item = item.name
         try:
-            return super(Memory, self).__contains__(item)
+            return dict.__contains__(self, item)
         except TypeError:
             return False
     
     def __getitem__(self, item):
+        if type(item) is str:
+            return dict.__getitem__(self, item)
         if isinstance(item, (VarArg, VarSpec)):
             item = item.name
-        return super(Memory, self).__getitem__(item)
+        return dict.__getitem__(self, item)
     
     def __setitem__(self, key, value):
+        if type(key) is str:
+            dict.__setitem__(self, key, value)
+            return value
         if isinstance(key, (VarArg, VarSpec)):
             key = key.name
-        super(Memory, self).__setitem__(key, value)
+        dict.__setitem__(self, key, value)
         return value
 
     @staticmethod
     def varspec(name, *args, **kwargs):
         """ Tkinter variable specification
 
-        Variables will be constructed via Variable[TYPE](master: tk, *args, **kwargs)
+        Variables will be constructed via Variable[TYPE](master: tk, *args, **kwargs); if Memory[name] already holds a
+        Variable instance (rather than a Variable type), that instance is used as-is and args and kwargs are ignored
 
         :param name: The name of the variable (its key in Memory)
         :param args: Positional arguments passed into Memory[name]'s constructor
@@ -101,7 +107,8 @@ def fire_grid(row=..., column=..., rowspan=..., columnspan=..., sticky=...,
     :param ipadx: How many pixels to pad widget, horizontally, inside widget's borders.
     :param ipady: How many pixels to pad widget, vertically, inside widget's borders.
     """
-    return spec('grid', **_clean_vargin(locals()), **kwargs)
+    return spec('grid', **_clean_vargin(row=row, column=column, rowspan=rowspan, columnspan=columnspan,
+                                        sticky=sticky, padx=padx, pady=pady, ipadx=ipadx, ipady=ipady), **kwargs)
 
 
 def fire_pack(side=..., fill=..., anchor=..., padx=..., pady=..., ipadx=..., ipady=..., expand=..., **kwargs):
@@ -116,7 +123,8 @@ def fire_pack(side=..., fill=..., anchor=..., padx=..., pady=..., ipadx=..., ipa
     :param ipady: How many pixels to pad widget, vertically, inside widget's borders.
     :param expand: expand widget if parent size grows
     """
-    return spec('pack', **_clean_vargin(locals()), **kwargs)
+    return spec('pack', **_clean_vargin(side=side, fill=fill, anchor=anchor, padx=padx, pady=pady,
+                                        ipadx=ipadx, ipady=ipady, expand=expand), **kwargs)
 
 
 def fire_place(x=..., y=..., relx=..., rely=..., anchor=...,
@@ -139,7 +147,8 @@ def fire_place(x=..., y=..., relx=..., rely=..., anchor=...,
     :param bordermode: whether to take border width of master widget into account
       ("inside" or "outside")
     """
-    return spec('place', **_clean_vargin(locals()), **kwargs)
+    return spec('place', **_clean_vargin(x=x, y=y, relx=relx, rely=rely, anchor=anchor, width=width, height=height,
+                                         relwidth=relwidth, relheight=relheight, bordermode=bordermode), **kwargs)
 
 
 def stub():
@@ -152,29 +161,37 @@ def stub():
 
 # #### Private ####
 class Stub:
-    def __init__(self, layout_type, layout_args, layout_kwargs):
+    __slots__ = ('master', 'layout')
+
+    def __init__(self, master, layout_type, layout_args, layout_kwargs):
+        self.master = master
         self.layout = layout_type, layout_args, layout_kwargs
 
 
 class VarSpec:
+    __slots__ = ('name', 'args', 'kwargs')
+
     def __init__(self, name, *args, **kwargs):
         self.name = name
         self.args = args
         self.kwargs = kwargs
 
     def construct(self, root, constructor) -> Variable:
+        if isinstance(constructor, Variable):
+            return constructor
         return constructor(root, *self.args, **self.kwargs)
 
 
 class VarArg:
+    __slots__ = ('name', 'unpack')
+
     def __init__(self, name, unpack=0):
-        if not 0 <= unpack <= 2:
+        if unpack not in (0, 1, 2):
             raise ValueError(f"A VarArg's unpack parameter must be between 0 and 2 (inclusive), not {unpack}")
 
         self.name = name
         self.unpack = unpack
 
 
-def _clean_vargin(vargs):
-    vargs.pop("kwargs", {})
-    return {k: v for k, v in vargs.items() if not isinstance(v, NOT_FILLED)}
+def _clean_vargin(**vargs):
+    return {k: v for k, v in vargs.items() if v is not ...}
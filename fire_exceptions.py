@@ -4,7 +4,6 @@ TODO: incorporate the ability to construct from a caught exception to provide mo
 
 @author: Richard "Ben" Canty
 """
-import traceback
 
 
 class TkFireException(Exception):
@@ -20,8 +20,14 @@ from tkfire import *
 import tkinter as tk
 from tkinter import scrolledtext as st
 from pprint import pprint
+import re
 import yaml
-from io import StringIO
+
+# Use the libyaml-backed loader/dumper when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
 
 # Define some convenience constants
 BOTH33 = {'fill': 'both', 'ipadx': 3, 'ipady': 3}
@@ -67,34 +73,83 @@ class YamlBox:
         self.textbox['xscrollcommand'] = self.textbox.vbar2.set
         self.textbox.vbar2.config(command=self.textbox.xview)
         self.notification = tk.Label(self.frame, text='--')
+        self._notice = '--'
+        # The last successfully parsed text and its document, so unchanged text is not re-parsed
+        self._cached_text = None
+        self._cached_doc = None
+        self._cached_range = None
+        # Whether the text was edited since the last parse; _on_modified folds the Text widget's modified flag into it
+        self._dirty = True
+        self.textbox.bind('<<Modified>>', self._on_modified, add='+')
         # Packing
         self.textbox.pack(expand=True, **TB33)
         self.textbox.vbar2.pack(side=tk.TOP, fill=tk.X)
         self.notification.pack(**TB33)
 
     def get(self, start, end):
+        """ Parses the text between start and end as YAML
+
+        The parsed document is cached and the same object is returned until the text changes, so callers must treat it
+        as read-only (copy it before making any changes).
+
+        :param start: Text widget index at which to start
+        :param end: Text widget index at which to end
+        :return: The parsed document (shared, do not mutate), or None if the text is empty or is not valid YAML
+        """
+        if not self._dirty and not self.textbox.edit_modified() and (start, end) == self._cached_range:
+            # The Text widget has not been edited since the last parse (and a <<Modified>> event is not waiting to be
+            # handled), so skip fetching its contents
+            return self._cached_doc
         text = self.textbox.get(start, end)
+        if text == self._cached_text:
+            self._cached_range = self._fixed_range(start, end)
+            self._dirty = False
+            return self._cached_doc
+        if not text.strip(' \r\n'):
+            # Only spaces and newlines (which YAML reads as an empty document), so there is nothing to parse; other
+            # whitespace such as tabs is left to the parser, which rejects it and reports where
+            self._notify('--')
+            return None
         try:
-            doc = yaml.safe_load(text)
+            doc = yaml.load(text, Loader=SafeLoader)
         except yaml.YAMLError as ye:
             mark = ye.problem_mark  # noqa: a YAMLError does contain the problem_mark attribute, PyCharm helper
             # is having some issues with this line
             line = mark.line + 1
             column = mark.column + 1
-            self.notification['text'] = f'YAML Error: L{line} C{column}'
+            self._notify(f'YAML Error: L{line} C{column}')
+            self._cached_text = self._cached_range = None
             return None
         else:
-            self.notification['text'] = '--'
+            self._notify('--')
+            self._cached_text, self._cached_doc, self._cached_range = text, doc, self._fixed_range(start, end)
+            self._dirty = False
             return doc
 
+    def _on_modified(self, _event=None):
+        # Resetting the flag fires <<Modified>> again, which then finds it already cleared and does nothing
+        if self.textbox.edit_modified():
+            self._dirty = True
+            self.textbox.edit_modified(False)
+
+    @staticmethod
+    def _fixed_range(start, end):
+        # Only 'line.char' indices and 'end' keep pointing at the same text while nothing is edited, marks such as
+        # 'insert' can move without an edit, so a range using them is never served from the cache
+        if all(index == tk.END or re.fullmatch(r'\d+\.\d+', str(index)) for index in (start, end)):
+            return start, end
+        return None
+
+    def _notify(self, text):
+        # Only reconfigure the Label (a round-trip into Tk) when its message actually changes
+        if text != self._notice:
+            self._notice = self.notification['text'] = text
+
     def delete(self, start, end):
         return self.textbox.delete(start, end)
 
     def insert(self, where, what):
-        stream = StringIO()
-        yaml.safe_dump(what, stream)
-        self.textbox.insert(where, stream.getvalue())
-        del stream
+        self.textbox.insert(where, yaml.dump(what, Dumper=SafeDumper))
 
     def pack(self, *args, **kwargs):
         return self.frame.pack(*args, **kwargs)
@@ -200,12 +255,14 @@ my_gui.bind_command(
 )
 
 # Second, let us add that 'sum_button'
+# The option variables were constructed during build, so they can be collected once rather than on every click
+opt_vars = [memory[f'opt{j}'] for j in range(n_options)]
 # The GUI can be modified using traditional tkinter grammar
 my_gui.build_stub('left_panel!sum_button',
                   tk.Button,
                   text="Sum Menus",
                   command=lambda *_: print(
-                      sum(memory[f'opt{j}'].get() for j in range(n_options))  # noqa: See note at bottom
+                      sum(var.get() for var in opt_vars)  # noqa: See note at bottom
                   )
                   )
 
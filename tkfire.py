@@ -5,6 +5,7 @@ reference components by Name.
 """
 
 import tkinter as tk
+from functools import partial
 from dispatching import *
 from fire_exceptions import *
 from pprint import pformat
@@ -12,7 +13,7 @@ from pprint import pformat
 
 __all__ = ["TkFire", "Memory", "spec", "post", "stub",
            "fire_pack", "fire_place", "fire_grid",
-           "LAYOUT", "TYPE", "CHILDREN", "POST"]
+           "LAYOUT", "TYPE", "CHILDREN", "POST", "LAZY"]
 
 
 # #### Constants #### #  #  #  #  #  #  #  #  #  #  #  #  #  #  #  #  #  #  #  #  #  #  #  #  #  #  #  #  #  #  #  #  #
@@ -20,11 +21,39 @@ LAYOUT = 'LAYOUT'
 TYPE = 'TYPE'
 CHILDREN = 'CHILDREN'
 POST = 'POST'
+LAZY = 'LAZY'
 
 SY = 'scrolly'
 SX = 'scrollx'
 
 
+# #### Helpers #### #  #  #  #  #  #  #  #  #  #  #  #  #  #  #  #  #  #  #  #  #  #  #  #  #  #  #  #  #  #  #  #  #
+
+_MISSING = object()
+
+
+def _pop_flag(flag, args, kwargs):
+    """ Removes a flag (e.g. SY) from a widget's args or kwargs, returning whether it was present """
+    if kwargs and kwargs.pop(flag, _MISSING) is not _MISSING:
+        return True
+    # Most widgets have no flag, so test first rather than pay for a ValueError from remove()
+    if flag in args:
+        args.remove(flag)
+        return True
+    return False
+
+
+class _SpecRepr:
+    """ Defers the pformat() of a mother element until an error message actually needs it """
+    __slots__ = ('spec', )
+
+    def __init__(self, spec):
+        self.spec = spec
+
+    def __str__(self):
+        return pformat(self.spec, depth=3)
+
+
 # #### TkFire #### #  #  #  #  #  #  #  #  #  #  #  #  #  #  #  #  #  #  #  #  #  #  #  #  #  #  #  #  #  #  #  #  #  #
 
 class TkFire:
@@ -48,6 +77,13 @@ class TkFire:
       of a widget is to omit the layout key, specifying {layout: spec(None)} is unnecessary and specifying
       {layout: None} will cause an error.
     - children is an optional element which keys to a dictionary with more TkFire Elements.
+    - lazy is an optional flag; if {lazy: True}, the children of the element are not built with the rest of the GUI
+      but the first time the element is mapped (shown) on screen, when a path below it is looked up through
+      TkFire's __getitem__ (e.g. my_ui["tab_2!entry"]), or when realize() is called on it.  This spares the
+      construction of widgets which may never be seen (e.g. the contents of a Notebook tab).  As the subtree is not
+      read by build(), a VarSpec within it is only constructed with the subtree (until then other references to that
+      name in memory get the Variable type, not an instance) and its errors are raised when it is built, possibly
+      from within the Tk <Map> event which shows it.
     - post is an optional element listing operations to be executed after the creation of the Object
       which is a list of lists of the form [[attribute: string, args: Tuple, kwargs: Dict], ...] where
       attribute is an attribute of the parent (the object created just before) which is called with args
@@ -76,6 +112,7 @@ class TkFire:
     | # Run
     | my_core.mainloop()
     """
+    __slots__ = ('core', 'memory', '_mother', 'gui', '_variable_map', '_pending', '__weakref__')
 
     def __init__(self, core, memory=None, mother: dict = None):
         """ Creates a TkFire object which allows a tkinter GUI to be created and modified using dictionary syntax.
@@ -103,10 +140,14 @@ class TkFire:
         self.gui = dict()  # maps to all widgets
         self._variable_map = dict()  # Whenever variable is bound to a widget,
         # this map stores {name_of_widget_in_gui: name_of_variable_in_memory}
+        self._pending = dict()  # maps the paths of LAZY widgets to their children which are yet to be built
 
     def __getitem__(self, item):
         if isinstance(item, tuple):
             item = "!".join(item)
+        if self._pending and isinstance(item, str) and item not in self.gui:
+            # Only a bang-path can lead into a LAZY subtree, any other missing key still raises a KeyError below
+            self._realize_towards(item)
         return self.gui[item]
 
     def __setitem__(self, key, value):
@@ -117,22 +158,20 @@ class TkFire:
     # Private
 
     def _sanitize_kwargs(self, kwargs, path, root):
-        replacer = list()
+        # Only the values of existing keys are replaced, which is safe to do while iterating
         for keyword, value in kwargs.items():
             # value is a constructor  # [ e.g. variable=VarSpec("Opt_1", value=0) ]
             if isinstance(value, VarSpec):
                 var_name = value.name
                 self._variable_map[path] = var_name
                 self.memory[var_name] = value.construct(root, self.memory[var_name])
-                replacer.append((keyword, self.memory[var_name]))
+                kwargs[keyword] = self.memory[var_name]
             # value is a reference  # [ e.g. values='options' ]
             elif value in self.memory:
-                replacer.append((keyword, self.memory[value]))
+                kwargs[keyword] = self.memory[value]
             # value is a literal  # [ e.g. values=[1, 2, 3, 4] ]
             else:
                 pass
-        for keyword, value in replacer:
-            kwargs[keyword] = value
 
     def _sanitize_args(self, args, kwargs, path, root):
         new_args = list()
@@ -171,6 +210,9 @@ class TkFire:
             layout_type, layout_args, layout_kwargs = child_spec.get(LAYOUT, [None, (), {}])
             post_methods = child_spec.get(POST, [])
             grandchildren = child_spec.get(CHILDREN, None)
+            # Work on copies so the mother is left untouched (and can be built again)
+            widget_kwargs = dict(widget_kwargs)
+            layout_kwargs = dict(layout_kwargs)
         except (LookupError, TypeError, ValueError) as pe:
             msg = f"Could not parse '{child_path}' from:\n{child_repr}"
             raise TkFireParseError(msg) from pe
@@ -206,23 +248,8 @@ class TkFire:
     @staticmethod
     def _get_scrolls(args, kwargs, child_path):
         try:
-            if SY in kwargs:
-                has_scroll_y = True
-                kwargs.pop(SY)
-            elif SY in args:
-                has_scroll_y = True
-                args.pop(args.index(SY))
-            else:
-                has_scroll_y = False
-
-            if SX in kwargs:
-                has_scroll_x = True
-                kwargs.pop(SX)
-            elif SX in args:
-                has_scroll_x = True
-                args.pop(args.index(SX))
-            else:
-                has_scroll_x = False
+            has_scroll_y = _pop_flag(SY, args, kwargs)
+            has_scroll_x = _pop_flag(SX, args, kwargs)
         except Exception as e:
             msg = f"Could not parse scrollbar for '{child_path}'"
             raise TkFireSpecificationError(msg) from e
@@ -230,17 +257,21 @@ class TkFire:
         return has_scroll_y, has_scroll_x
 
     def _bind_scrolls(self, root, child_path, has_scroll_y, has_scroll_x):
+        if not (has_scroll_y or has_scroll_x):
+            return
+
         try:
+            widget = self.gui[child_path]
             if has_scroll_y:
-                self.gui[child_path + '!Scrolly'] = tk.Scrollbar(root)
-                self.gui[child_path]['yscrollcommand'] = self.gui[child_path + '!Scrolly'].set
-                self.gui[child_path + '!Scrolly'].config(command=self.gui[child_path].yview)
-                self.gui[child_path + '!Scrolly'].pack(side=tk.RIGHT, fill=tk.Y)
+                scroll_y = self.gui[child_path + '!Scrolly'] = tk.Scrollbar(root)
+                widget['yscrollcommand'] = scroll_y.set
+                scroll_y.config(command=widget.yview)
+                scroll_y.pack(side=tk.RIGHT, fill=tk.Y)
             if has_scroll_x:
-                self.gui[child_path + '!Scrollx'] = tk.Scrollbar(root, orient=tk.HORIZONTAL)
-                self.gui[child_path]['xscrollcommand'] = self.gui[child_path + '!Scrollx'].set
-                self.gui[child_path + '!Scrollx'].config(command=self.gui[child_path].xview)
-                self.gui[child_path + '!Scrollx'].pack(side=tk.BOTTOM, fill=tk.X)
+                scroll_x = self.gui[child_path + '!Scrollx'] = tk.Scrollbar(root, orient=tk.HORIZONTAL)
+                widget['xscrollcommand'] = scroll_x.set
+                scroll_x.config(command=widget.xview)
+                scroll_x.pack(side=tk.BOTTOM, fill=tk.X)
         except Exception as e:
             msg = f"Could not bind scrollbars for '{child_path}'"
             raise TkFireSpecificationError(msg) from e
@@ -263,7 +294,8 @@ class TkFire:
             msg = f"Could not render '{child_path}' from:\n{child_repr}"
             raise TkFireRenderError(msg) from e
 
-    def _execute_post(self, post_method, method_args, method_kwargs, root, child_path):
+    def _execute_post(self, widget, post_method, method_args, method_kwargs, root, child_path):
+        method_kwargs = dict(method_kwargs)
         try:
             method_args = self._sanitize_args(method_args, method_kwargs, child_path, root)
         except Exception as e:
@@ -275,27 +307,30 @@ class TkFire:
             msg = f"Could not parse keyword arguments for {child_path}'s type operation:\n{post_method}"
             raise TkFirePostError(msg) from e
         try:
-            getattr(self.gui[child_path], post_method)(*method_args, **method_kwargs)
+            getattr(widget, post_method)(*method_args, **method_kwargs)
         except Exception as e:
             msg = f"Could not execute post method {post_method} specified in '{child_path}'"
             raise TkFirePostError(msg) from e
 
     def _build(self, parent, structure):
-        """ Constructs the dictionary which contains all the widgets (recursively)
+        """ Constructs the dictionary which contains all the widgets
 
-        commits to self.gui
+        commits to self.gui.  The mother is walked depth-first, in mother order, with an explicit stack rather than by
+        recursion (so deeply nested GUIs are not limited by the interpreter's recursion depth).  Each element is built
+        completely (widget, layout, POST operations, and scrollbars) and then all of its descendants are built before
+        its next sibling.  This order matters to Memory: once a VarSpec has constructed memory[name], every element
+        built after it (including the siblings of its ancestors) is given that Variable rather than its type.
 
-        :param parent: The parent widget
+        :param parent: The path of the parent widget ("" for the core)
         :param structure: a (sub) dictionary of the mother
         :return: None
         """
-        if not structure:
-            return
+        gui = self.gui
 
         # construct the path and load the parent widget
         try:
             if parent:
-                root = self.gui[parent]
+                root = gui[parent]
                 path = parent + "!"
             else:
                 root = self.core
@@ -303,37 +338,72 @@ class TkFire:
         except Exception as e:
             raise TkFireStructuralError(f"Failed to create path for '{parent}'") from e
 
-        # For each widget...
-        for child_name, child_spec in structure.items():
-            child_path = path + child_name
-            child_repr = pformat(child_spec, depth=3)
+        # Each frame of the stack carries its parent widget, its path prefix, and an iterator over the children it has
+        # left to build, so neither the widget nor the prefix is rebuilt when a frame is resumed
+        stack = [(root, path, iter(structure.items()))]
+
+        while stack:
+            root, path, children = stack[-1]
 
-            widget_type, widget_args, widget_kwargs, \
-                layout_type, layout_args, layout_kwargs, \
-                post_methods, \
-                grandchildren = \
-                self._validate_specifications(root, child_spec, child_path, child_repr)
+            # For each widget...
+            for child_name, child_spec in children:
+                child_path = path + child_name
+                child_repr = _SpecRepr(child_spec)
 
-            if widget_type is Stub:
-                self.gui[child_path] = Stub(layout_type, layout_args, layout_kwargs)
-                continue
+                widget_type, widget_args, widget_kwargs, \
+                    layout_type, layout_args, layout_kwargs, \
+                    post_methods, \
+                    grandchildren = \
+                    self._validate_specifications(root, child_spec, child_path, child_repr)
 
-            # Set flags for handling scrollbars
-            has_scroll_y, has_scroll_x = self._get_scrolls(widget_args, widget_kwargs, child_path)
+                if widget_type is Stub:
+                    gui[child_path] = Stub(root, layout_type, layout_args, layout_kwargs)
+                    continue
 
-            # Build the object
-            self._generate(root, child_path, child_repr, widget_type, *widget_args, **widget_kwargs)
+                # Set flags for handling scrollbars
+                has_scroll_y, has_scroll_x = self._get_scrolls(widget_args, widget_kwargs, child_path)
 
-            # Define its layout
-            self._render(child_path, layout_type, layout_args, layout_kwargs, child_repr)
+                # Build the object
+                self._generate(root, child_path, child_repr, widget_type, *widget_args, **widget_kwargs)
 
-            # Execute post operations:
-            for post_method, method_args, method_kwargs in post_methods:
-                self._execute_post(post_method, method_args, method_kwargs, root, child_path)
+                # Define its layout
+                self._render(child_path, layout_type, layout_args, layout_kwargs, child_repr)
 
-            self._bind_scrolls(root, child_path, has_scroll_y, has_scroll_x)
+                # Execute post operations:
+                if post_methods:
+                    widget = gui[child_path]
+                    for post_method, method_args, method_kwargs in post_methods:
+                        self._execute_post(widget, post_method, method_args, method_kwargs, root, child_path)
 
-            self._build(child_path, grandchildren)
+                self._bind_scrolls(root, child_path, has_scroll_y, has_scroll_x)
+
+                # Only descend into (or defer) elements which actually have children
+                if not grandchildren:
+                    continue
+                if child_spec.get(LAZY, False):
+                    self._defer(child_path, grandchildren)
+                else:
+                    # Build the children next, the remaining siblings are resumed once they are done
+                    stack.append((gui[child_path], child_path + "!", iter(grandchildren.items())))
+                    break
+            else:
+                stack.pop()
+
+    def _defer(self, child_path, grandchildren):
+        self._pending[child_path] = grandchildren
+        try:
+            bind = getattr(self.gui[child_path], 'bind', None)
+            if bind is not None:
+                bind('<Map>', lambda *_: self.realize(child_path), add='+')
+        except Exception as e:
+            msg = f"Could not defer the children of '{child_path}'"
+            raise TkFireSpecificationError(msg) from e
+
+    def _realize_towards(self, path):
+        # Build any LAZY ancestors of path (outermost first, as realizing one may reveal another)
+        names = path.split("!")
+        for i in range(1, len(names)):
+            self.realize("!".join(names[:i]))
 
     # Main
 
@@ -341,6 +411,16 @@ class TkFire:
         self._build("", self._mother)
         return self
 
+    def realize(self, path):
+        """ Builds the children of a LAZY widget (does nothing if they have already been built)
+
+        :param path: The gui path to the LAZY widget (e.g. "main!tab_2")
+        :return: None
+        """
+        structure = self._pending.pop(path, None)
+        if structure:
+            self._build(path, structure)
+
     def bind_commands(self, *args):
         """ Binds commands after build() is called. Calls self.bind_command() on each tuple passed
 
@@ -356,7 +436,7 @@ class TkFire:
         :param path: The gui path to the Widget (e.g. "main!left!button_5")
         :param command: The callable being bound to the command component
         """
-        self.gui[path]['command'] = command
+        self[path]['command'] = command
 
     def set_optionmenu_options(self, path, options=None, *, variable=None, option_names=None):
         """ Updates the options presented in an OptionMenu
@@ -380,18 +460,22 @@ class TkFire:
             variable = self.memory[var_name]
 
         if option_names is None:
-            option_names = [str(opt) for opt in options]
-        elif callable(option_names):
-            option_names = [option_names(opt) for opt in options]
+            option_names = str
+        if callable(option_names):
+            labeled_options = ((opt, option_names(opt)) for opt in options)
+        else:
+            labeled_options = zip(options, option_names)  # strict=True
 
-        for opt, opt_name in zip(options, option_names):  # strict=True
-            option_menu.add_command(label=opt_name,
-                                    command=lambda value=opt: variable.set(value))
+        add_command = option_menu.add_command
+        setter = variable.set
+        for opt, opt_name in labeled_options:
+            add_command(label=opt_name, command=partial(setter, opt))
 
     def build_stub(self, path, generator, *args, **kwargs):
         """ Converts a stub into real object.
 
-        The parent widget (master) is calculated here, and so should not be included in the args parameter.
+        The parent widget (master) is the one recorded when the stub was built, and so should not be included in the
+        args parameter.
 
         :param path: The gui path to the Widget (e.g. "main!left!button_5")
         :param generator: The constructor for the Widget
@@ -399,13 +483,10 @@ class TkFire:
         :param kwargs: Keyword arguments to be passed to the generator
         :return: The new widget
         """
-        widget: Stub = self.gui[path]
+        widget: Stub = self[path]
         layout_type, layout_args, layout_kwargs = widget.layout
 
-        parent_path, _ = path.rsplit("!", 1)
-        parent = self.gui[parent_path]
-
-        self._generate(parent, path, f"{generator} called with args={args}, kwargs={kwargs}",
+        self._generate(widget.master, path, f"{generator} called with args={args}, kwargs={kwargs}",
                        generator, *args, **kwargs)
 
         getattr(self.gui[path], layout_type)(*layout_args, **layout_kwargs)